@@ -11,9 +11,11 @@ CSV record format:
 
 Filename format (for valid records):
     MAH11-YYYYMMDD-HHMMSS.pcap
+    MAH11-YYYYMMDD-HHMMSS-NNNNNN.pcap   (bulk mode, NNNNNN = sequence number)
 
 Modes:
     SPACE   Generate a valid file in SRC_DIR and a matching CSV record.
+    b       Generate BULK_RECORD_COUNT valid files and CSV records in one batch.
     1       Generate 'missing_field' invalid CSV record.
     2       Generate 'empty_path' invalid CSV record.
     3       Generate 'extra_row' invalid CSV record.
@@ -26,13 +28,16 @@ Modes:
 
 import os
 import sys
+import atexit
 import termios
 import tty
 import time
 import hashlib
+import itertools
 import configparser
+from functools import partial
 from pathlib import Path
-from typing import Optional, Tuple # Added Tuple
+from typing import Callable, Dict, Iterator, Optional, Tuple
 
 # -----------------------------------------------------------------------------
 # LOAD CONFIGURATION FROM config.ini
@@ -63,8 +68,10 @@ try:
         print(f"CRITICAL: Missing required configuration in {CONFIG_PATH}: {e}", file=sys.stderr)
         sys.exit(1)
 
-    SRC_DIR_PATH = Path(src_dir_str).resolve()
-    CSV_DIR_PATH = Path(csv_dir_str).resolve()
+    # absolute() is enough here: the uploader resolves symlinks itself when it
+    # validates CSV paths, so skip the realpath walk at startup.
+    SRC_DIR_PATH = Path(src_dir_str).absolute()
+    CSV_DIR_PATH = Path(csv_dir_str).absolute()
     CSV_FILE_PATH = CSV_DIR_PATH / csv_filename
 
     print(f"  Using Source Dir : {SRC_DIR_PATH}")
@@ -86,6 +93,8 @@ if SRC_DIR_PATH is None or CSV_FILE_PATH is None:
 # -----------------------------------------------------------------------------
 FILE_CONTENT = b"test file content for pcap"  # Test file content
 FILE_HASH = hashlib.sha256(FILE_CONTENT).hexdigest()
+_HASH_SUFFIX = "," + FILE_HASH + "\n"  # Precomposed ",<hash>\n" tail for CSV lines
+BULK_RECORD_COUNT = 1000  # Number of valid records generated per 'b' keypress
 
 # -----------------------------------------------------------------------------
 # ENSURE DIRECTORIES EXIST
@@ -98,6 +107,17 @@ except Exception as e:
     print(f"CRITICAL: Failed to create necessary directories: {e}", file=sys.stderr)
     sys.exit(1)
 
+# String prefixes for building record paths by concatenation in the generators.
+_SRC_PREFIX = os.fspath(SRC_DIR_PATH) + os.sep
+# Directory used for 'outside' path records; None if /tmp is not usable, in
+# which case those records fall back to a relative path.
+_TMP_PREFIX: Optional[str] = "/tmp/"
+try:
+    os.makedirs(_TMP_PREFIX, exist_ok=True) # Ensure /tmp exists
+except OSError as e:
+    print(f"Warning: Could not use /tmp for 'outside' paths ({e}), using relative paths instead.", file=sys.stderr)
+    _TMP_PREFIX = None
+
 
 # -----------------------------------------------------------------------------
 # HELPER FUNCTIONS
@@ -105,40 +125,66 @@ except Exception as e:
 def getch():
     """
     Read a single character from standard input without waiting for Enter.
+    The terminal must already be in cbreak mode (see main()).
     Unix-like systems ONLY.
     """
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(fd)
-        ch = sys.stdin.read(1)
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    return ch
+    return sys.stdin.read(1)
 
 
 # --- CSV Record Generation Helpers ---
 
-def generate_valid_record() -> Tuple[Optional[str], Optional[Path]]:
+# Last (epoch second, 'YYYYMMDD-HHMMSS') pair produced by _ts_str().
+_last_ts = [0, ""]
+
+
+def _ts_str() -> Tuple[int, str]:
+    """
+    Returns the current epoch second and its local 'YYYYMMDD-HHMMSS' string.
+    The formatted string is reused while the second is unchanged, so bursts of
+    keypresses (or bulk mode) only run strftime once per second.
+    """
+    now = time.time_ns() // 1_000_000_000
+    if now != _last_ts[0]:
+        _last_ts[:] = [now, time.strftime("%Y%m%d-%H%M%S", time.localtime(now))]
+    return _last_ts[0], _last_ts[1]
+
+
+def _make_filename(ts: str, seq: Optional[int] = None) -> str:
+    """
+    Returns the pcap filename for a formatted 'YYYYMMDD-HHMMSS' timestamp.
+    A sequence number, if given, is appended so names stay unique within a second.
+    """
+    if seq is None:
+        return f"MAH11-{ts}.pcap"
+    return f"MAH11-{ts}-{seq:06d}.pcap"
+
+
+def generate_valid_record(seq: Optional[int] = None, verbose: bool = True) -> Tuple[Optional[str], Optional[str]]:
     """
     Generates a valid record:
       - Creates a new file in SRC_DIR with the content FILE_CONTENT.
-      - Returns the CSV record (as a string) and the file's Path, or (None, None) on error.
+      - Returns the CSV record (as a string) and the file's path string, or (None, None) on error.
+    'seq' is passed through to the filename (see _make_filename); 'verbose'
+    controls the per-file progress message (errors are always reported).
     """
-    epoch_time = int(time.time())
-    current_time = time.localtime()
-    filename = f"MAH11-{time.strftime('%Y%m%d-%H%M%S', current_time)}.pcap"
-    file_path = SRC_DIR_PATH / filename
+    epoch_time, ts = _ts_str()
+    filename = _make_filename(ts, seq)
+    file_path = _SRC_PREFIX + filename
 
     try:
-        with file_path.open("wb") as f:
-            f.write(FILE_CONTENT)
-        print(f"Created file: {file_path}")
-    except Exception as e:
+        # Raw fd write: the payload is tiny, so skip the buffered IO layer.
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, FILE_CONTENT)
+        finally:
+            os.close(fd)
+        if verbose:
+            print(f"Created file: {file_path}")
+    except OSError as e:
         print(f"Error creating file {file_path}: {e}", file=sys.stderr)
         return None, None # Return None for csv_line on error
 
-    csv_line = f"{epoch_time},{file_path},{FILE_HASH}\n"
+    csv_line = f"{epoch_time},{file_path}" + _HASH_SUFFIX
     return csv_line, file_path
 
 
@@ -153,26 +199,25 @@ def generate_error_record(error_type: str) -> str:
       - "extra_row": Contains an extra CSV row.
       - "garbled": Completely invalid CSV data.
     """
-    epoch_time = int(time.time())
+    epoch_time, ts = _ts_str()
     # For a reference valid file path string, we use the valid filename format.
-    current_time = time.localtime()
-    filename = f"MAH11-{time.strftime('%Y%m%d-%H%M%S', current_time)}.pcap"
+    filename = _make_filename(ts)
     # Use a constructed valid file path, though no file will be created here.
-    valid_path = str(SRC_DIR_PATH / filename)
+    valid_path = _SRC_PREFIX + filename
 
     csv_line = "" # Initialize
     if error_type == "missing_field":
         csv_line = f"{epoch_time}\n"
     elif error_type == "empty_path":
-        csv_line = f"{epoch_time},,{FILE_HASH}\n" # Note the double comma
+        csv_line = f"{epoch_time}," + _HASH_SUFFIX # Note the double comma
     elif error_type == "extra_row":
-        csv_line = f"{epoch_time},{valid_path},{FILE_HASH}\nEXTRA,ROW,DATA\n"
+        csv_line = f"{epoch_time},{valid_path}" + _HASH_SUFFIX + "EXTRA,ROW,DATA\n"
     elif error_type == "garbled":
         csv_line = "garbled data, not, even close\nto csv format!\n" # Ensure newline
     else:
         # Fallback to a valid-looking format if unknown type is passed (defensive)
         print(f"Warning: Unknown error_type '{error_type}' in generate_error_record", file=sys.stderr)
-        csv_line = f"{epoch_time},{valid_path},{FILE_HASH}\n"
+        csv_line = f"{epoch_time},{valid_path}" + _HASH_SUFFIX
 
     print(f"Generated error CSV ({error_type}): {csv_line.strip()}")
     return csv_line
@@ -187,33 +232,64 @@ def generate_fail_record(fail_type: str) -> str:
       - "relative": Uses a relative path (filename only).
       - "outside": Uses an absolute path outside SRC_DIR (e.g., under /tmp).
     """
-    epoch_time = int(time.time())
-    current_time = time.localtime()
-    filename = f"MAH11-{time.strftime('%Y%m%d-%H%M%S', current_time)}.pcap"
+    epoch_time, ts = _ts_str()
+    filename = _make_filename(ts)
 
     file_path_str = "" # Initialize
     if fail_type == "relative":
         file_path_str = filename  # relative: no directory info
     elif fail_type == "outside":
-        # Ensure /tmp exists or use a more reliable temporary location if needed
-        # For simplicity, using /tmp is common in examples
-        temp_dir = Path("/tmp")
-        try:
-            temp_dir.mkdir(exist_ok=True) # Ensure /tmp exists
-            file_path_str = str(temp_dir / filename)
-        except OSError as e:
-            print(f"Warning: Could not use /tmp for 'outside' path ({e}), using relative path instead.", file=sys.stderr)
-            file_path_str = filename # Fallback if /tmp is not usable
+        # /tmp is checked once at startup; fall back to relative if it was unusable
+        if _TMP_PREFIX is not None:
+            file_path_str = _TMP_PREFIX + filename
+        else:
+            file_path_str = filename
     else:
          # Fallback to relative path if unknown type is passed (defensive)
         print(f"Warning: Unknown fail_type '{fail_type}' in generate_fail_record", file=sys.stderr)
         file_path_str = filename
 
-    csv_line = f"{epoch_time},{file_path_str},{FILE_HASH}\n"
+    csv_line = f"{epoch_time},{file_path_str}" + _HASH_SUFFIX
     print(f"Generated fail CSV ({fail_type}): {csv_line.strip()}")
     return csv_line
 
 
+def _valid_csv_line() -> Optional[str]:
+    """Creates a valid file and returns only its CSV line (None on error)."""
+    csv_line, _ = generate_valid_record() # We don't need file_path here
+    return csv_line
+
+
+# Running sequence for bulk filenames. It is never reset, so two batches
+# within the same second cannot reuse (and overwrite) each other's files.
+_bulk_seq = itertools.count()
+
+
+def bulk_valid(n: int) -> Iterator[str]:
+    """
+    Creates up to n valid files and yields their CSV lines, for use with
+    writelines(). Files that fail to be created are reported and skipped.
+    """
+    for _ in range(n):
+        csv_line, _ = generate_valid_record(next(_bulk_seq), verbose=False)
+        if csv_line:
+            yield csv_line
+
+
+# --- Keystroke Dispatch Table ---
+# Maps a (lower-cased) key to (record generator, description used in logging).
+# 'b' (bulk), 't' (truncate) and 'q' (quit) are handled directly in main().
+_DISPATCH: Dict[str, Tuple[Callable[[], Optional[str]], str]] = {
+    " ": (_valid_csv_line, "valid"),
+    "1": (partial(generate_error_record, "missing_field"), "error (missing_field)"),
+    "2": (partial(generate_error_record, "empty_path"), "error (empty_path)"),
+    "3": (partial(generate_error_record, "extra_row"), "error (extra_row)"),
+    "4": (partial(generate_error_record, "garbled"), "error (garbled)"),
+    "r": (partial(generate_fail_record, "relative"), "fail (relative path)"),
+    "o": (partial(generate_fail_record, "outside"), "fail (outside path)"),
+}
+
+
 # -----------------------------------------------------------------------------
 # MAIN FUNCTION
 # -----------------------------------------------------------------------------
@@ -223,6 +299,7 @@ def main():
     print(f"  CSV File: {CSV_FILE_PATH}")
     print("Press key for action:")
     print("  SPACE : Create VALID file and append valid CSV record.")
+    print(f"    b   : Create {BULK_RECORD_COUNT} VALID files and append their CSV records.")
     print("  Error Record Types (CSV format errors):")
     print("    1   : Append 'missing_field' invalid CSV record.")
     print("    2   : Append 'empty_path' invalid CSV record.")
@@ -235,58 +312,71 @@ def main():
     print("    t   : Truncate (empty) the CSV file.")
     print("    q   : Quit.")
 
-    while True:
-        ch = getch().lower() # Read character and convert to lower case
-        csv_line_to_append: Optional[str] = None
-        operation_description = "" # For consistent logging
-
-        if ch == " ":
-            # Generate valid record: create file and CSV entry.
-            csv_line, _ = generate_valid_record() # We don't need file_path here
-            if csv_line:
-                csv_line_to_append = csv_line
-                operation_description = "valid"
-        elif ch == "1":
-            csv_line_to_append = generate_error_record("missing_field")
-            operation_description = "error (missing_field)"
-        elif ch == "2":
-            csv_line_to_append = generate_error_record("empty_path")
-            operation_description = "error (empty_path)"
-        elif ch == "3":
-            csv_line_to_append = generate_error_record("extra_row")
-            operation_description = "error (extra_row)"
-        elif ch == "4":
-            csv_line_to_append = generate_error_record("garbled")
-            operation_description = "error (garbled)"
-        elif ch == "r":
-            csv_line_to_append = generate_fail_record("relative")
-            operation_description = "fail (relative path)"
-        elif ch == "o":
-            csv_line_to_append = generate_fail_record("outside")
-            operation_description = "fail (outside path)"
-        elif ch == "t":
-            try:
-                # Open the CSV file in write mode to truncate (empty) it.
-                with CSV_FILE_PATH.open("w", encoding="utf-8") as csv_file:
-                    csv_file.truncate(0)
-                print("CSV file truncated successfully.")
-            except Exception as e:
-                print(f"Error truncating CSV file: {e}", file=sys.stderr)
-            # No CSV line to append for truncate operation
-            continue # Go to next loop iteration
-        elif ch == "q":
-            print("\nQuitting test data generator.")
-            break
-        # else: Ignore other inputs silently
-
-        # Append the generated line (if any)
-        if csv_line_to_append:
-            try:
-                with CSV_FILE_PATH.open("a", encoding="utf-8") as csv_file:
-                    csv_file.write(csv_line_to_append)
-                print(f"Appended {operation_description} CSV: {csv_line_to_append.strip()}")
-            except Exception as e:
-                print(f"Error appending {operation_description} CSV record: {e}", file=sys.stderr)
+    # Keep one line-buffered handle open for the whole session instead of
+    # reopening the CSV file for every appended record.
+    try:
+        csv_fp = CSV_FILE_PATH.open("a", buffering=1, encoding="utf-8")
+    except Exception as e:
+        print(f"CRITICAL: Failed to open CSV file {CSV_FILE_PATH}: {e}", file=sys.stderr)
+        sys.exit(1)
+    atexit.register(csv_fp.close)
+
+    # Switch the terminal to cbreak mode once for the whole session rather than
+    # saving/restoring its attributes around every keypress. cbreak (unlike raw)
+    # keeps output processing and Ctrl-C working while input is unbuffered.
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    try:
+        while True:
+            ch = getch().lower() # Read character and convert to lower case
+            csv_line_to_append: Optional[str] = None
+            operation_description = "" # For consistent logging
+
+            entry = _DISPATCH.get(ch)
+            if entry is not None:
+                handler, operation_description = entry
+                csv_line_to_append = handler()
+            elif ch == "b":
+                try:
+                    # Create the batch's files first, then let writelines() fill the
+                    # buffer and flush once for the batch rather than once per line.
+                    lines = list(bulk_valid(BULK_RECORD_COUNT))
+                    csv_fp.reconfigure(line_buffering=False)
+                    try:
+                        csv_fp.writelines(lines)
+                        csv_fp.flush()
+                    finally:
+                        csv_fp.reconfigure(line_buffering=True)
+                    print(f"Appended {len(lines)} of {BULK_RECORD_COUNT} bulk valid CSV records.")
+                except Exception as e:
+                    print(f"Error appending bulk valid CSV records: {e}", file=sys.stderr)
+                continue # Go to next loop iteration
+            elif ch == "t":
+                try:
+                    # Truncate in place through the open handle (same inode).
+                    csv_fp.seek(0)
+                    csv_fp.truncate()
+                    print("CSV file truncated successfully.")
+                except Exception as e:
+                    print(f"Error truncating CSV file: {e}", file=sys.stderr)
+                # No CSV line to append for truncate operation
+                continue # Go to next loop iteration
+            elif ch == "q":
+                print("\nQuitting test data generator.")
+                break
+            # else: Ignore other inputs silently
+
+            # Append the generated line (if any)
+            if csv_line_to_append:
+                try:
+                    csv_fp.write(csv_line_to_append)
+                    csv_fp.flush()
+                    print(f"Appended {operation_description} CSV: {csv_line_to_append.strip()}")
+                except Exception as e:
+                    print(f"Error appending {operation_description} CSV record: {e}", file=sys.stderr)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
 if __name__ == '__main__':
@@ -1,39 +1,57 @@
 #!/usr/bin/env python3
 """
 A simple Flask app that emulates an upload endpoint at /pcap.
-It receives files via HTTP POST; every other file upload is delayed by 6 seconds
+It receives files via HTTP POST; every 20th file upload is delayed by 6 seconds
 to simulate a timeout scenario.
+For load testing: gunicorn -c gunicorn_conf.py data_rx:app
 """
 
 from flask import Flask, request
+import hashlib
+import itertools
 import time
 import logging
 
 app = Flask(__name__)
 logging.basicConfig(level=logging.INFO)
 
-# Global counter to alternate delay behavior.
-upload_counter = 0
+# Global counter to alternate delay behavior (next() is atomic across threads).
+_upload_counter = itertools.count(1)
+
+# Size of each read from the request body stream.
+READ_CHUNK_SIZE = 64 * 1024
 
 
 @app.route('/pcap', methods=['POST'])
 def upload():
-    global upload_counter
-    upload_counter += 1
+    upload_number = next(_upload_counter)
 
-    file_name = request.headers.get('x-filename', 'unknown')
+    # Read headers straight from the WSGI environ to skip EnvironHeaders lookups.
+    environ = request.environ
+    file_name = environ.get('HTTP_X_FILENAME', 'unknown')
 
-    # Use get_data() instead of data
-    data = request.get_data()  # <<< CHANGE THIS LINE
-    data_length = len(data) if data else 0
+    # Per-request details (including the digest) are debug-only; skip building
+    # them, and hashing the body at all, at higher levels.
+    want_details = app.logger.isEnabledFor(logging.DEBUG)
 
-    # Log the received Content-Type for debugging
-    content_type = request.headers.get('Content-Type')
-    app.logger.info(f"Received Content-Type: {content_type}")
+    # Consume the body in chunks so the upload is never buffered in memory,
+    # hashing as we go so the digest can be checked against the CSV record.
+    data_length = 0
+    sha256 = hashlib.sha256()
+    stream = request.stream
+    while True:
+        chunk = stream.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        data_length += len(chunk)
+        if want_details:
+            sha256.update(chunk)
 
-    app.logger.info("Received file '%s' (%d bytes)", file_name, data_length)
+    if want_details:
+        app.logger.debug("Received Content-Type: %s", environ.get('CONTENT_TYPE'))
+        app.logger.debug("Received file '%s' (%d bytes, sha256 %s)", file_name, data_length, sha256.hexdigest())
 
-    if upload_counter % 20 == 0:
+    if upload_number % 20 == 0:
         app.logger.info("Delaying response for file '%s' to simulate timeout...", file_name)
         time.sleep(6)
 
@@ -41,5 +59,6 @@ def upload():
 
 
 if __name__ == '__main__':
+    # Development fallback; use gunicorn_conf.py for anything load-related.
     # Run the app on all interfaces on port 8989.
     app.run(host="0.0.0.0", port=8989)
@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for the data_rx upload endpoint simulator.
+
+Usage:
+    gunicorn -c gunicorn_conf.py data_rx:app
+
+Runs a single worker with a pool of threads; the threads absorb the simulated
+6 second delay without stalling other uploads. Keep workers at 1: data_rx's
+upload counter lives in process memory, so each extra worker (or instance)
+would count and delay on its own instead of every 20th upload overall.
+"""
+
+bind = "0.0.0.0:8989"
+worker_class = "gthread"
+workers = 1
+threads = 16